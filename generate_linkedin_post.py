@@ -7,12 +7,128 @@ and generates a formatted LinkedIn post with statistics and key highlights.
 """
 
 import re
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+# Cache fetched pages locally (revalidated with ETag/Last-Modified) when available
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Prefer the C-based lxml parser, which is much faster on the long changelog pages
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+
+# Precompiled regular expressions used while scanning the documentation pages.
+# Compiling them once avoids re-parsing the patterns inside the per-element loops.
+
+# Tags in order of specificity (Major Feature before Feature), so that the
+# longer alternative wins when several start at the same position
+_TAG_SEARCH_ORDER = ('Major Feature', 'API Change', 'Feature', 'Efficiency', 'Enhancement', 'Fix')
+_TAG_CANONICAL = {tag.lower(): tag for tag in _TAG_SEARCH_ORDER}
+# Lower-cased substrings, one of which any tagged item must contain
+# ('major feature' is covered by 'feature')
+_TAG_KEYWORDS = ('feature', 'efficiency', 'enhancement', 'fix', 'api change')
+# A tag either starts a line or follows the documented object (e.g. "sklearn.foo.Bar Fix")
+_TAG_ALT_RE = re.compile(
+    r'(?:^\s*|sklearn\.\w+[^\n]*?)\b(?P<tag>'
+    + '|'.join(re.escape(tag) for tag in _TAG_SEARCH_ORDER)
+    + r')\b',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Version headings
+_ANY_VERSION_RE = re.compile(r'Version \d+\.\d+', re.I)
+_VERSION_PREFIX_RE = re.compile(r'Version \d+\.\d+')
+_PATCH_VERSION_RE = re.compile(r'Version \d+\.\d+\.\d+#?$', re.I)
+
+# Legend section
+_LEGEND_HEADING_RE = re.compile('Legend', re.I)
+_LEGEND_CLASS_RE = re.compile('legend', re.I)
+_LEGEND_TEXT_RE = re.compile('Legend for changelog', re.I)
+
+# Highlight text cleanup
+_MAIN_CONTENT_CLASS_RE = re.compile(r'section|content|body|document', re.I)
+_CAMEL_CASE_RE = re.compile(r'([a-z])([A-Z])')
+_PAREN_SPACING_RE = re.compile(r'([a-zA-Z0-9])(\()')
+_WS_RE = re.compile(r'\s+')
+# Characters allowed in all-caps text (e.g. navigation labels)
+_ALL_CAPS_CHARS = string.ascii_uppercase + string.whitespace + '\xa0'
+_CHANGE_PREFIX_RE = re.compile(r'^(feature|enhancement|fix|improvement):\s*', re.I)
+
+# Highlights from release notes
+_RELEASE_HIGHLIGHTS_RE = re.compile(r'release.*highlight', re.I)
+_MAJOR_FEATURE_RE = re.compile(r'\bMajor Feature\b', re.I)
+_MAJOR_FEATURE_SPLIT_RE = re.compile(r'Major Feature[:\s]+', re.I)
+_FEATURE_RE = re.compile(r'\bFeature\b', re.I)
+_FEATURE_SPLIT_RE = re.compile(r'Feature[:\s]+', re.I)
+_SKLEARN_MODULE_RE = re.compile(r'^sklearn\.\w+')
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+
+# Contributors section
+_CONTRIBUTOR_HEADING_RES = (
+    re.compile(r'code.*documentation.*contributor', re.I),
+    re.compile(r'contributor', re.I),
+    re.compile(r'thanks.*contributor', re.I),
+)
+_CONTRIBUTOR_TEXT_RE = re.compile(r'code.*documentation.*contributor', re.I)
+_CONTRIBUTOR_HEADER_PREFIX_RE = re.compile(r'^.*?code.*documentation.*contributor.*?:?\s*', re.I)
+_THANKS_PREFIX_RE = re.compile(r'^.*?thanks to.*?:?\s*', re.I)
+_INCLUDING_PREFIX_RE = re.compile(r'^.*?including\s+', re.I)
+_WHO_SUFFIX_RE = re.compile(r'\s+who.*$', re.I)
+_INCLUDING_SUFFIX_RE = re.compile(r'\s+including.*$', re.I)
+_AND_RE = re.compile(r'\s+and\s+', re.I)
+# Digits or HTML/formatting artifacts, checked once [bot] suffixes are removed
+_INVALID_NAME_RE = re.compile(r'[\d<>{}[\]()]')
+_SKIP_WORDS = frozenset({
+    'the', 'and', 'or', 'by', 'to', 'of', 'in', 'on', 'at', 'for',
+    'with', 'from', 'including', 'thanks', 'everyone', 'who', 'has', 'have',
+    'contributed', 'maintenance', 'improvement', 'since', 'version', 'project',
+})
+
+
+def _is_all_caps(text: str, min_length: int) -> bool:
+    """Check whether text is only uppercase letters and whitespace."""
+    return len(text) >= min_length and not text.strip(_ALL_CAPS_CHARS)
+
+
+def _strip_bullet(text: str) -> str:
+    """Remove a leading "*", "-" or "1." bullet marker."""
+    if text.startswith(('*', '-')):
+        return text[1:].lstrip()
+    number_length = len(text) - len(text.lstrip(string.digits))
+    if number_length and text[number_length:number_length + 1] == '.':
+        return text[number_length + 1:].lstrip()
+    return text
+
+
+def _split_names(text: str) -> List[str]:
+    """Split text on commas that are not inside brackets (e.g. "[bot]")."""
+    names = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(text):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth = max(depth - 1, 0)
+        elif char == ',' and depth == 0:
+            names.append(text[start:i])
+            start = i + 1
+    names.append(text[start:])
+    return names
+
 
 class ReleaseNotesParser:
     """Parser for scikit-learn release notes pages."""
@@ -35,34 +151,110 @@ class ReleaseNotesParser:
             version: Version string (e.g., '1.7', '1.8')
         """
         self.version = version
+        
+        # Version-derived strings and patterns, computed once
+        self._version_dash = version.replace('.', '-')
+        self._version_underscore = version.replace('.', '_')
+        self._version_escaped = re.escape(version)
+        # Main version heading (e.g., "Version 1.7.0" or "Version 1.7.0#")
+        self._main_version_re = re.compile(rf'Version {self._version_escaped}\.0#?$', re.I)
+        # Next minor version heading (e.g., "Version 1.8"), if the version is numeric
+        try:
+            self._major, self._minor = map(int, version.split('.'))
+            self._next_version_re = re.compile(rf'Version {self._major}\.{self._minor + 1}#?$', re.I)
+        except ValueError:
+            self._major = self._minor = None
+            self._next_version_re = None
+        
         self.base_url = "https://scikit-learn.org/stable"
+        # Reuse connections (and TLS sessions) across requests to the docs host
+        if requests_cache is not None:
+            self._session = requests_cache.CachedSession(
+                'sklearn_release_cache',
+                backend='sqlite',
+                use_cache_dir=True,
+                cache_control=True,
+                expire_after=3600,
+            )
+        else:
+            self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers['User-Agent'] = 'sklearn-release-post'
+        # Results computed per parsed page, keyed by id() of the soup
+        self._index_cache = {}
+        self._legend_cache = {}
+        self._main_section_cache = {}
         
     def fetch_page(self, url: str) -> BeautifulSoup:
         """Fetch and parse an HTML page."""
         try:
-            response = requests.get(url, timeout=30)
+            response = self._session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return BeautifulSoup(response.content, _HTML_PARSER)
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}", file=sys.stderr)
             sys.exit(1)
     
     def get_release_notes_url(self) -> str:
         """Get the URL for release notes page."""
-        return f"{self.base_url}/whats_new/v{self.version}.html#release-notes-{self.version.replace('.', '-')}"
+        return f"{self.base_url}/whats_new/v{self.version}.html#release-notes-{self._version_dash}"
     
     def get_release_highlights_url(self) -> str:
         """Get the URL for release highlights page."""
-        version_underscore = self.version.replace('.', '_')
-        return f"{self.base_url}/auto_examples/release_highlights/plot_release_highlights_{version_underscore}_0.html"
+        return f"{self.base_url}/auto_examples/release_highlights/plot_release_highlights_{self._version_underscore}_0.html"
+    
+    def _cached_per_soup(self, cache: dict, soup: BeautifulSoup, compute):
+        """Return compute(soup), computing it at most once per soup."""
+        cached = cache.get(id(soup))
+        if cached is None or cached[0] is not soup:
+            # Keep a reference to the soup so its id() cannot be reused while cached
+            cached = cache[id(soup)] = (soup, compute(soup))
+        return cached[1]
+    
+    def _element_index(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Collect the headings, list items and paragraphs of a page in one traversal.
+        
+        The result is cached per soup so the helpers scanning the same page share
+        it instead of each walking the whole tree again.
+        
+        Returns:
+            Dictionary mapping 'h1', 'h2', 'h3', 'li' and 'p' to the matching
+            elements, plus 'headings' with all h1/h2/h3 in document order and
+            'text', the element texts cached by _element_text()
+        """
+        return self._cached_per_soup(self._index_cache, soup, self._build_element_index)
+    
+    def _build_element_index(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Build the element index returned by _element_index()."""
+        index = {'h1': [], 'h2': [], 'h3': [], 'li': [], 'p': [], 'headings': [], 'text': {}}
+        for element in soup.find_all(['h1', 'h2', 'h3', 'li', 'p']):
+            index[element.name].append(element)
+            if element.name in ('h1', 'h2', 'h3'):
+                index['headings'].append(element)
+        return index
+    
+    def _element_text(self, index: Dict[str, Any], element) -> str:
+        """Return element.get_text(), computing it at most once per element."""
+        texts = index['text']
+        text = texts.get(id(element))
+        if text is None:
+            text = texts[id(element)] = element.get_text()
+        return text
     
     def find_legend_section(self, soup: BeautifulSoup) -> BeautifulSoup:
         """Find the legend section to exclude from counting."""
+        return self._cached_per_soup(self._legend_cache, soup, self._find_legend_section)
+    
+    def _find_legend_section(self, soup: BeautifulSoup) -> BeautifulSoup:
+        """Look up the legend section returned by find_legend_section()."""
         # Look for the legend section - it's usually near the top
         legend_patterns = [
-            soup.find('h2', string=re.compile('Legend', re.I)),
-            soup.find('div', class_=re.compile('legend', re.I)),
-            soup.find('p', string=re.compile('Legend for changelog', re.I)),
+            soup.find('h2', string=_LEGEND_HEADING_RE),
+            soup.find('div', class_=_LEGEND_CLASS_RE),
+            soup.find('p', string=_LEGEND_TEXT_RE),
         ]
         
         legend = None
@@ -81,63 +273,45 @@ class ReleaseNotesParser:
         Returns:
             Tuple of (start_element, end_element) or (None, None) if not found
         """
+        return self._cached_per_soup(self._main_section_cache, soup, self._find_main_version_section)
+    
+    def _find_main_version_section(self, soup: BeautifulSoup):
+        """Look up the boundaries returned by find_main_version_section()."""
         # Look for the main version heading (e.g., "Version 1.7.0" or "Version 1.7.0#")
-        # Headings may have "#" at the end
-        main_version_pattern = rf'Version {re.escape(self.version)}\.0#?$'
+        # Headings may have "#" at the end, in a separate headerlink element, so
+        # we match on the heading text rather than using find(string=...)
+        index = self._element_index(soup)
         main_version_heading = None
-        
-        # Find all headings and filter manually
         for heading_tag in ['h2', 'h3', 'h1']:
-            headings = soup.find_all(heading_tag)
-            for heading in headings:
-                text = heading.get_text().strip()
-                if re.match(main_version_pattern, text, re.I):
-                    main_version_heading = heading
-                    break
+            main_version_heading = next(
+                (heading for heading in index[heading_tag]
+                 if self._main_version_re.match(self._element_text(index, heading).strip())),
+                None,
+            )
             if main_version_heading:
                 break
         
         if not main_version_heading:
             return None, None
         
-        # Find the end boundary - the next version heading at the same level
-        # Look for headings like "Version 1.7.1", "Version 1.7.2" (patch versions)
-        heading_level = main_version_heading.name
-        next_version_pattern = r'Version \d+\.\d+\.\d+#?$'
-        next_version_heading = None
-        
-        # Find all headings of the same level after main_version_heading
-        all_headings = soup.find_all(heading_level)
+        # Find the end boundary - the next version heading at the same level, in a
+        # single pass over those headings. Prefer a patch version after the main
+        # heading (e.g., "Version 1.7.1"), else the next minor version (e.g., "Version 1.8")
+        next_minor_heading = None
         found_start = False
-        for heading in all_headings:
-            if heading == main_version_heading:
+        for heading in index[main_version_heading.name]:
+            if heading is main_version_heading:
                 found_start = True
                 continue
-            if found_start:
-                text = heading.get_text().strip()
-                # Check if this is a patch version (e.g., 1.7.1, 1.7.2)
-                if re.match(next_version_pattern, text, re.I):
-                    # Make sure it's a patch version of the same release, not a new major version
-                    if self.version in text:
-                        next_version_heading = heading
-                        break
-        
-        # If no patch version found, look for next major version (e.g., "Version 1.8")
-        if not next_version_heading:
-            try:
-                major, minor = map(int, self.version.split('.'))
-                parent_version_pattern = rf'Version {major}\.{minor + 1}#?$'
-                for heading in all_headings:
-                    if heading == main_version_heading:
-                        continue
-                    text = heading.get_text().strip()
-                    if re.match(parent_version_pattern, text, re.I):
-                        next_version_heading = heading
-                        break
-            except (ValueError, IndexError):
-                pass
-        
-        return main_version_heading, next_version_heading
+            text = self._element_text(index, heading).strip()
+            # Check if this is a patch version of the same release, not a new major version
+            if found_start and _PATCH_VERSION_RE.match(text) and self.version in text:
+                return main_version_heading, heading
+            if (next_minor_heading is None and self._next_version_re and
+                    self._next_version_re.match(text)):
+                next_minor_heading = heading
+        
+        return main_version_heading, next_minor_heading
     
     def count_tags_in_content(self, soup: BeautifulSoup) -> Dict[str, int]:
         """
@@ -153,94 +327,66 @@ class ReleaseNotesParser:
         main_version_start, main_version_end = self.find_main_version_section(soup)
         
         if not main_version_start:
-            # Fallback: if we can't find the main version section, count everything
-            # but still exclude legend
-            main_version_start = soup
-            main_version_end = None
+            # Without the main version heading there is no section to count
+            return counts
         
         # Find the legend section to exclude
+        # (tracked by id(): hashing a Tag serializes its whole subtree)
         legend = self.find_legend_section(soup)
-        legend_list_items = set()
+        legend_item_ids = set()
         if legend:
             # Find the list that contains legend items (usually <ul> or <ol> after legend heading)
             legend_list = legend.find_next(['ul', 'ol'])
             if legend_list:
                 # Get all list items in the legend list
-                legend_list_items = set(legend_list.find_all('li'))
+                legend_item_ids = {id(li) for li in legend_list.find_all('li')}
             else:
                 # Fallback: find list items that come before the first version heading
-                first_version_heading = soup.find(['h1', 'h2'], string=re.compile(r'Version \d+\.\d+', re.I))
+                first_version_heading = soup.find(['h1', 'h2'], string=_ANY_VERSION_RE)
                 if first_version_heading:
-                    # Get all list items that come before the first version heading
-                    all_lis_before_version = soup.find_all('li')
-                    for li in all_lis_before_version:
-                        # Check if this li comes before the first version heading
-                        li_prev_headings = li.find_all_previous(['h1', 'h2'], limit=20)
-                        if not any(h == first_version_heading for h in li_prev_headings):
+                    # Collect the list items that come before the first version heading,
+                    # stopping as soon as we reach it
+                    for element in soup.next_elements:
+                        if element is first_version_heading:
+                            break
+                        if element.name == 'li':
                             # This li comes before any version heading, likely part of legend
-                            legend_list_items.add(li)
+                            legend_item_ids.add(id(element))
         
-        # Count tags directly by searching from the start heading
-        # Get all list items after the start heading
-        all_lis = list(main_version_start.find_all_next('li'))  # Convert to list to ensure we can iterate multiple times
+        index = self._element_index(soup)
         
-        # Process each list item and count tags directly
-        for li in all_lis:
-            # Skip if this list item is part of the legend
-            if li in legend_list_items:
-                continue
-            
-            item_text = li.get_text()
-            
-            # Verify this list item belongs to the main version section (1.7.0)
-            # by checking that Version 1.7.0 appears in its previous headings
-            prev_headings = li.find_all_previous(['h1', 'h2', 'h3'], limit=50)
-            belongs_to_main_version = False
-            found_other_version = False
+        # Walk forward once from the start heading, keeping track of the headings
+        # we pass, until we leave the main version section (1.7.0)
+        for element in main_version_start.next_elements:
+            # Stop if we've reached the end marker (next version section)
+            if element is main_version_end:
+                break
             
-            for h in prev_headings:
-                if h == main_version_start:
-                    belongs_to_main_version = True
+            if element.name in ('h1', 'h2', 'h3'):
+                heading_text = self._element_text(index, element).strip()
+                # Stop if we hit another version heading
+                if _ANY_VERSION_RE.match(heading_text):
                     break
-                # Check if we hit another version heading before finding 1.7.0
-                heading_text = h.get_text().strip()
-                if re.match(r'Version \d+\.\d+', heading_text, re.I) and h != main_version_start:
-                    found_other_version = True
+                # Stop if we've reached the contributors section (for last version section)
+                if not main_version_end and 'code and documentation contributor' in heading_text.lower():
                     break
+                continue
             
-            # Skip if this item doesn't belong to our version section
-            if not belongs_to_main_version:
-                # If we found another version section, we can stop entirely
-                if found_other_version:
-                    break
+            # Skip anything but list items, and list items that are part of the legend
+            if element.name != 'li' or id(element) in legend_item_ids:
                 continue
             
-            # Stop if we've reached the end marker (next version section)
-            if main_version_end:
-                if any(h == main_version_end for h in prev_headings):
-                    break
+            item_text = self._element_text(index, element)
             
-            # Stop if we've reached the contributors section (for last version section)
-            if not main_version_end:
-                # Check if contributors section appears in previous headings
-                found_contributors = False
-                for h in prev_headings:
-                    heading_text = h.get_text().strip().lower()
-                    if 'code and documentation contributor' in heading_text:
-                        found_contributors = True
-                        break
-                if found_contributors:
-                    # We've reached the contributors section, stop counting
-                    break
+            # Cheap substring check first: most items can't contain any tag
+            item_text_lower = item_text.lower()
+            if not any(keyword in item_text_lower for keyword in _TAG_KEYWORDS):
+                continue
             
-            # Check for tags in order of specificity (Major Feature before Feature)
-            for tag_type in ['Major Feature', 'API Change', 'Feature', 'Efficiency', 'Enhancement', 'Fix']:
-                escaped_tag = re.escape(tag_type)
-                pattern = r'\b' + escaped_tag + r'\b'
-                regex_pattern = r'^\s*' + pattern + r'|sklearn\.\w+.*?' + pattern
-                if re.search(regex_pattern, item_text, re.IGNORECASE | re.MULTILINE):
-                    counts[tag_type] += 1
-                    break
+            # Count the first tag found in the item
+            match = _TAG_ALT_RE.search(item_text)
+            if match:
+                counts[_TAG_CANONICAL[match.group('tag').lower()]] += 1
         
         # Strategy 2: Disabled - Strategy 1 (list items) already captures all tag entries correctly
         # Badge elements were causing false positives by matching "Feature" in longer text
@@ -261,7 +407,7 @@ class ReleaseNotesParser:
             nav.decompose()
         
         # Look for the main content area
-        main_content = soup.find('div', class_=re.compile(r'section|content|body|document', re.I))
+        main_content = soup.find('div', class_=_MAIN_CONTENT_CLASS_RE)
         if not main_content:
             main_content = soup.find('main') or soup.find('article') or soup.find('body')
         if not main_content:
@@ -277,34 +423,45 @@ class ReleaseNotesParser:
         for heading in h2_headings:
             text = heading.get_text(separator=' ', strip=True)  # Use separator to handle split text
             # Remove trailing # symbols that are common in documentation
-            text = re.sub(r'#+$', '', text).strip()
+            text = text.rstrip('#').strip()
             # Fix spacing issues (e.g., "inCalibrated" -> "in Calibrated")
-            text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+            text = _CAMEL_CASE_RE.sub(r'\1 \2', text)
             # Fix spacing around punctuation - add space before parentheses
-            text = re.sub(r'([a-zA-Z0-9])(\()', r'\1 \2', text)
+            text = _PAREN_SPACING_RE.sub(r'\1 \2', text)
             # Normalize multiple spaces
-            text = re.sub(r'\s+', ' ', text)
+            text = _WS_RE.sub(' ', text)
             text = text.strip()
             
             # Skip navigation and non-content headings
             if (len(text) > 5 and len(text) < 200 and
                 not any(skip in text.lower() for skip in skip_headings) and
-                not re.match(r'^[A-Z\s]{2,}$', text)):  # Skip all-caps
+                not _is_all_caps(text, 2)):  # Skip all-caps
                 highlights.append(text)
+                if len(highlights) >= 10:  # Limit to top 10 highlights
+                    break
         
         # If we found h2 highlights, return them early (they're the main bullet points)
         if highlights:
-            return highlights[:10]  # Limit to top 10 highlights
+            return highlights
+        
+        # Highlights collected by the fallback strategies, deduplicated
+        # case-insensitively as we go
+        seen = set()
         
         # Strategy 1b: Fallback to h3/h4 headings if no h2 found
         headings = main_content.find_all(['h3', 'h4'])
         for heading in headings:
             text = heading.get_text(strip=True)
-            text = re.sub(r'#+$', '', text).strip()
+            text = text.rstrip('#').strip()
             if (len(text) > 10 and len(text) < 150 and
                 not any(skip in text.lower() for skip in skip_headings) and
-                not re.match(r'^[A-Z\s]{2,}$', text)):
-                highlights.append(text)
+                not _is_all_caps(text, 2)):
+                text_lower = text.lower()
+                if text_lower not in seen:
+                    seen.add(text_lower)
+                    highlights.append(text)
+                    if len(highlights) >= 7:
+                        return highlights
         
         # Strategy 2: Look for list items in the main content
         list_items = main_content.find_all('li')
@@ -314,13 +471,17 @@ class ReleaseNotesParser:
                            'related projects', 'previous', 'next', 'contents']
             if (len(text) > 20 and len(text) < 300 and
                 not any(skip in text.lower() for skip in skip_patterns) and
-                not re.match(r'^[A-Z\s]{3,}$', text)):  # Skip all-caps navigation
-                text = re.sub(r'\s+', ' ', text)
-                text = re.sub(r'^\*\s*|^-\s*|^\d+\.\s*', '', text)
+                not _is_all_caps(text, 3)):  # Skip all-caps navigation
+                text = _WS_RE.sub(' ', text)
+                text = _strip_bullet(text)
                 # Remove common prefixes
-                text = re.sub(r'^(feature|enhancement|fix|improvement):\s*', '', text, flags=re.I)
-                if text and text not in highlights:
+                text = _CHANGE_PREFIX_RE.sub('', text)
+                text_lower = text.lower()
+                if text and text_lower not in seen:
+                    seen.add(text_lower)
                     highlights.append(text)
+                    if len(highlights) >= 7:
+                        return highlights
         
         # Strategy 3: Look for paragraphs with substantial content
         paragraphs = main_content.find_all('p')
@@ -330,32 +491,31 @@ class ReleaseNotesParser:
                            'related projects', 'copyright', 'license']
             if (len(text) > 30 and len(text) < 250 and
                 not any(skip in text.lower() for skip in skip_patterns)):
-                text = re.sub(r'\s+', ' ', text)
-                if text and text not in highlights:
+                text = _WS_RE.sub(' ', text)
+                text_lower = text.lower()
+                if text and text_lower not in seen:
+                    seen.add(text_lower)
                     highlights.append(text)
+                    if len(highlights) >= 7:
+                        return highlights
         
-        # Remove duplicates and limit
-        seen = set()
-        unique_highlights = []
-        for h in highlights:
-            h_lower = h.lower()
-            if h_lower not in seen:
-                seen.add(h_lower)
-                unique_highlights.append(h)
-        
-        return unique_highlights[:7]
+        return highlights
     
     def extract_highlights_from_notes(self, soup: BeautifulSoup) -> List[str]:
         """
         Extract highlights from the release notes page itself.
         Looks for major sections and features mentioned.
+        
+        Only the first 6 highlights are kept, so each strategy stops as soon
+        as that many have been found.
         """
         highlights = []
         seen_highlights = set()
+        index = self._element_index(soup)
         
         # Strategy 1: Look for "Release Highlights" section at the top
         release_highlights_heading = soup.find(['h1', 'h2', 'h3'], 
-                                              string=re.compile(r'release.*highlight', re.I))
+                                              string=_RELEASE_HIGHLIGHTS_RE)
         if release_highlights_heading:
             # Get list items or paragraphs following this heading
             parent = release_highlights_heading.find_parent(['div', 'section']) or release_highlights_heading
@@ -364,58 +524,65 @@ class ReleaseNotesParser:
                 text = item.get_text(strip=True)
                 if len(text) > 20 and len(text) < 200:
                     # Clean up
-                    text = re.sub(r'^\*\s*|^-\s*|^\d+\.\s*', '', text)
+                    text = _strip_bullet(text)
                     if text.lower() not in seen_highlights:
                         seen_highlights.add(text.lower())
                         highlights.append(text)
         
         # Strategy 2: Look for major feature entries in changelog
         # Find list items that contain "Major Feature" or important features
-        all_list_items = soup.find_all('li')
+        all_list_items = index['li']
         for item in all_list_items[:50]:  # Check first 50 items
-            item_text = item.get_text()
+            if len(highlights) >= 6:
+                break
+            
+            item_text = self._element_text(index, item)
             
             # Skip if it's a module heading (contains #)
             if '#' in item_text and len(item_text) < 50:
                 continue
             
             # Look for Major Feature entries
-            if re.search(r'\bMajor Feature\b', item_text, re.I):
+            if _MAJOR_FEATURE_RE.search(item_text):
                 # Extract the description after "Major Feature"
                 # Format is usually: "Major Feature description text"
-                parts = re.split(r'Major Feature[:\s]+', item_text, flags=re.I, maxsplit=1)
+                parts = _MAJOR_FEATURE_SPLIT_RE.split(item_text, maxsplit=1)
                 if len(parts) > 1:
                     desc = parts[1].strip()
                     # Take first sentence or first 150 chars
-                    desc = re.split(r'[.!?]\s+', desc)[0]
+                    desc = _SENTENCE_END_RE.split(desc)[0]
                     desc = desc[:150].strip()
                     if len(desc) > 20 and desc.lower() not in seen_highlights:
                         seen_highlights.add(desc.lower())
                         highlights.append(desc)
             
             # Look for Feature entries with important keywords
-            elif re.search(r'\bFeature\b', item_text, re.I):
+            elif _FEATURE_RE.search(item_text):
                 # Extract meaningful feature descriptions
                 # Skip if it's just a module name
-                if not re.match(r'^sklearn\.\w+', item_text.strip()):
+                if not _SKLEARN_MODULE_RE.match(item_text.strip()):
                     # Extract text after "Feature"
-                    parts = re.split(r'Feature[:\s]+', item_text, flags=re.I, maxsplit=1)
+                    parts = _FEATURE_SPLIT_RE.split(item_text, maxsplit=1)
                     if len(parts) > 1:
                         desc = parts[1].strip()
                         # Look for meaningful descriptions (not just module paths)
                         if len(desc) > 25 and 'sklearn.' not in desc[:30]:
-                            desc = re.split(r'[.!?]\s+', desc)[0]
+                            desc = _SENTENCE_END_RE.split(desc)[0]
                             desc = desc[:150].strip()
                             if len(desc) > 20 and desc.lower() not in seen_highlights and len(highlights) < 6:
                                 seen_highlights.add(desc.lower())
                                 highlights.append(desc)
         
         # Strategy 3: Look for section headings that describe major features
-        headings = soup.find_all(['h2', 'h3'])
-        for heading in headings:
+        for heading in index['headings']:
+            if len(highlights) >= 6:
+                break
+            if heading.name == 'h1':
+                continue
+            
             text = heading.get_text(strip=True)
             # Skip version numbers and navigation
-            if re.match(r'Version \d+\.\d+', text) or 'navigation' in text.lower() or '#' in text:
+            if _VERSION_PREFIX_RE.match(text) or 'navigation' in text.lower() or '#' in text:
                 continue
             
             # Look for feature-related section names
@@ -441,21 +608,14 @@ class ReleaseNotesParser:
         contributor_heading = None
         
         # Pattern 1: Look for heading with "Code and documentation contributors"
-        patterns = [
-            r'code.*documentation.*contributor',
-            r'contributor',
-            r'thanks.*contributor'
-        ]
-        
-        for pattern in patterns:
-            contributor_heading = soup.find(['h2', 'h3', 'h4', 'h5'], 
-                                           string=re.compile(pattern, re.I))
+        for pattern in _CONTRIBUTOR_HEADING_RES:
+            contributor_heading = soup.find(['h2', 'h3', 'h4', 'h5'], string=pattern)
             if contributor_heading:
                 break
         
         # Pattern 2: Try finding by text content in any element
         if not contributor_heading:
-            contributor_text_nodes = soup.find_all(string=re.compile(r'code.*documentation.*contributor', re.I))
+            contributor_text_nodes = soup.find_all(string=_CONTRIBUTOR_TEXT_RE)
             if contributor_text_nodes:
                 for node in contributor_text_nodes:
                     parent = node.find_parent(['h2', 'h3', 'h4', 'h5', 'p', 'div'])
@@ -468,45 +628,15 @@ class ReleaseNotesParser:
         
         # Find the content section containing contributor names
         # The names are usually in a paragraph or div following the heading
+        # (possibly a few elements away), so walk the following elements once
         contributor_section = None
-        
-        # Try next siblings (may be a few elements away)
-        current = contributor_heading.find_next_sibling(['p', 'div'])
-        for _ in range(5):  # Check up to 5 siblings
-            if current:
-                text = current.get_text()
-                # Look for a paragraph/div with many comma-separated names
-                if ',' in text and len(text) > 200 and text.count(',') > 10:
-                    contributor_section = current
-                    break
-                current = current.find_next_sibling(['p', 'div'])
-            else:
+        for candidate in contributor_heading.find_all_next(['p', 'div'], limit=15):
+            text = candidate.get_text()
+            # Look for a paragraph/div with many comma-separated names
+            if len(text) > 200 and text.count(',') > 10:
+                contributor_section = candidate
                 break
         
-        # If not found in siblings, try next elements (not just siblings)
-        if not contributor_section:
-            current = contributor_heading.find_next(['p', 'div'])
-            for _ in range(10):  # Check up to 10 next elements
-                if current:
-                    text = current.get_text()
-                    if ',' in text and len(text) > 200 and text.count(',') > 10:
-                        contributor_section = current
-                        break
-                    current = current.find_next(['p', 'div'])
-                else:
-                    break
-        
-        # If still not found, get the parent and look for paragraphs within it
-        if not contributor_section:
-            parent = contributor_heading.find_parent(['div', 'section', 'article'])
-            if parent:
-                paragraphs = parent.find_all('p')
-                for para in paragraphs:
-                    text = para.get_text()
-                    if ',' in text and len(text) > 200 and text.count(',') > 10:
-                        contributor_section = para
-                        break
-        
         if not contributor_section:
             return 0
         
@@ -515,55 +645,40 @@ class ReleaseNotesParser:
         
         # Extract the list of names - usually starts after "Thanks to" or "Code and documentation contributors:"
         # Remove the heading text if it's in the same element
-        contributor_text = re.sub(r'^.*?code.*documentation.*contributor.*?:?\s*', '', contributor_text, flags=re.I)
-        contributor_text = re.sub(r'^.*?thanks to.*?:?\s*', '', contributor_text, flags=re.I)
+        contributor_text = _CONTRIBUTOR_HEADER_PREFIX_RE.sub('', contributor_text)
+        contributor_text = _THANKS_PREFIX_RE.sub('', contributor_text)
         
         # Remove common prefixes and suffixes
-        contributor_text = re.sub(r'^.*?including\s+', '', contributor_text, flags=re.I)
-        contributor_text = re.sub(r'\s+who.*$', '', contributor_text, flags=re.I)
-        contributor_text = re.sub(r'\s+including.*$', '', contributor_text, flags=re.I)
+        contributor_text = _INCLUDING_PREFIX_RE.sub('', contributor_text)
+        contributor_text = _WHO_SUFFIX_RE.sub('', contributor_text)
+        contributor_text = _INCLUDING_SUFFIX_RE.sub('', contributor_text)
         
         # Contributors are listed as comma-separated names
         # Handle patterns like "Name1, Name2, Name3, and Name4"
         # Split by commas, but be careful with brackets like "[bot]"
         # First, handle "and" before splitting
-        contributor_text = re.sub(r'\s+and\s+', ', ', contributor_text, flags=re.I)
+        contributor_text = _AND_RE.sub(', ', contributor_text)
         
         # Split by commas
-        names = re.split(r',\s*(?![^[]*\])', contributor_text)
+        names = _split_names(contributor_text)
         
         # Clean up names
         names = [name.strip() for name in names if name.strip()]
         
         # Filter out non-name patterns
         filtered_names = []
-        skip_words = {'the', 'and', 'or', 'by', 'to', 'of', 'in', 'on', 'at', 'for', 
-                     'with', 'from', 'including', 'thanks', 'everyone', 'who', 'has', 'have',
-                     'contributed', 'maintenance', 'improvement', 'since', 'version', 'project'}
-        
         for name in names:
-            name_clean = name.strip()
             # Remove trailing punctuation
-            name_clean = re.sub(r'[.,;:]+$', '', name_clean).strip()
+            name_clean = name.rstrip('.,;:').strip()
+            name_lower = name_clean.lower()
             
-            # Skip empty or very short names
-            if len(name_clean) < 2:
-                continue
-            
-            # Skip if it's a common word
-            if name_clean.lower() in skip_words:
-                continue
-            
-            # Skip if it contains digits (except [bot] which is valid)
-            if re.search(r'\d', name_clean.replace('[bot]', '')):
-                continue
-            
-            # Skip if it contains HTML/formatting artifacts
-            if re.search(r'[<>{}[\]()]', name_clean.replace('[bot]', '')):
-                continue
-            
-            # Skip if it starts with common prefixes
-            if name_clean.lower().startswith(('including', 'thanks', 'the ')):
+            # Skip empty or very short names, common words, names containing
+            # digits or formatting artifacts (except [bot] which is valid),
+            # and names starting with common prefixes
+            if (len(name_clean) < 2 or
+                name_lower in _SKIP_WORDS or
+                _INVALID_NAME_RE.search(name_clean.replace('[bot]', '')) or
+                name_lower.startswith(('including', 'thanks', 'the '))):
                 continue
             
             # Valid name - add it
@@ -573,19 +688,24 @@ class ReleaseNotesParser:
     
     def generate_linkedin_post(self) -> str:
         """Generate the LinkedIn post content."""
-        # Fetch release notes
         notes_url = self.get_release_notes_url()
-        notes_soup = self.fetch_page(notes_url)
+        highlights_url = self.get_release_highlights_url()
+        
+        # Fetch release notes and highlights concurrently, so we only wait
+        # for the slower of the two requests
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            notes_future = executor.submit(self.fetch_page, notes_url)
+            highlights_future = executor.submit(self.fetch_page, highlights_url)
+            notes_soup = notes_future.result()
         
         # Extract data from release notes
         tag_counts = self.count_tags_in_content(notes_soup)
         contributor_count = self.count_contributors(notes_soup)
         
         # Try to extract highlights from release highlights page
-        highlights_url = self.get_release_highlights_url()
         highlights = []
         try:
-            highlights_soup = self.fetch_page(highlights_url)
+            highlights_soup = highlights_future.result()
             highlights = self.extract_highlights(highlights_soup)
         except requests.RequestException:
             # If highlights page doesn't exist or fails, that's OK
@@ -611,8 +731,10 @@ class ReleaseNotesParser:
             highlight = highlight.strip()
             if highlight:
                 # Remove markdown formatting if present
-                highlight = re.sub(r'^\*\s*', '', highlight)
-                highlight = re.sub(r'^-\s*', '', highlight)
+                if highlight.startswith('*'):
+                    highlight = highlight[1:].lstrip()
+                if highlight.startswith('-'):
+                    highlight = highlight[1:].lstrip()
                 post_lines.append(f"▶️ {highlight}")
         
         post_lines.extend([